@@ -1,19 +1,25 @@
 import json
 
+# 固定欄位的 JSON 模板（與 json.dumps 輸出相同），直接格式化以省去 json.dumps
+AXIS_TEMPLATE = ('{"motion_type": "axis", "joint1": %r, "joint2": %r, "joint3": %r, '
+                 '"joint4": %r, "joint5": %r, "joint6": %r}')
+
 if 'joints' not in locals() or len(joints) != 6:
     raise ValueError("輸入的 'joints' 必須是一個包含 6 個數值的 list。")
 
+joint_vals = tuple(float(j) for j in joints)
+
 axis_data = {
     "motion_type": "axis",
-    "joint1": float(joints[0]),
-    "joint2": float(joints[1]),
-    "joint3": float(joints[2]),
-    "joint4": float(joints[3]),
-    "joint5": float(joints[4]),
-    "joint6": float(joints[5])
+    "joint1": joint_vals[0],
+    "joint2": joint_vals[1],
+    "joint3": joint_vals[2],
+    "joint4": joint_vals[3],
+    "joint5": joint_vals[4],
+    "joint6": joint_vals[5]
 }
 # result 可輸出 dict 或 JSON 字串，依 GH 需求選擇
 result = axis_data
 # 若要輸出 JSON 字串，請取消註解下行
 # result = json.dumps(axis_data, indent=4)
-axis_command = json.dumps(axis_data)
\ No newline at end of file
+axis_command = AXIS_TEMPLATE % joint_vals
@@ -7,6 +7,13 @@ try:
 except Exception:
     rg = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_RAD2DEG = 180.0 / math.pi
+
 
 def _compute_rpy_from_axes(x_axis, y_axis, z_axis):
     """Compute roll, pitch, yaw (deg) from right-handed axes using ZYX convention.
@@ -24,17 +31,19 @@ def _compute_rpy_from_axes(x_axis, y_axis, z_axis):
     r32 = y_axis.Z
     r33 = z_axis.Z
 
-    sy = math.sqrt(r11 * r11 + r21 * r21)
+    # hypot of the first column, not sqrt(1 - r31^2): composed plane axes can leave
+    # r31 a few ulps short of +-1 at gimbal lock, which must still read as singular
+    sy = math.hypot(r11, r21)
     singular = sy < 1e-9
 
     if not singular:
-        yaw = math.degrees(math.atan2(r21, r11))
-        pitch = math.degrees(math.atan2(-r31, sy))
-        roll = math.degrees(math.atan2(r32, r33))
+        yaw = math.atan2(r21, r11) * _RAD2DEG
+        pitch = math.atan2(-r31, sy) * _RAD2DEG
+        roll = math.atan2(r32, r33) * _RAD2DEG
     else:
         # Gimbal lock
-        yaw = math.degrees(math.atan2(-r12, r22))
-        pitch = math.degrees(math.atan2(-r31, sy))
+        yaw = math.atan2(-r12, r22) * _RAD2DEG
+        pitch = math.atan2(-r31, sy) * _RAD2DEG
         roll = 0.0
 
     return roll, pitch, yaw
@@ -44,7 +53,7 @@ def _build_axes_from_z(z_axis):
     """Given a Z axis (Vector3d), build a stable right-handed frame (X, Y, Z).
 
     Uses world X as reference; if nearly parallel, switches to world Y.
-    X = Z x refX; Y = Z x X.
+    X = Z x refX; Y = Z x X (already unit: Z and X are unit and orthogonal).
     """
     z = rg.Vector3d(z_axis)
     if not z.Unitize():
@@ -57,7 +66,6 @@ def _build_axes_from_z(z_axis):
     x = rg.Vector3d.CrossProduct(z, ref_x)
     _ = x.Unitize()
     y = rg.Vector3d.CrossProduct(z, x)
-    _ = y.Unitize()
 
     return x, y, z
 
@@ -77,11 +85,9 @@ def plane_to_movej(plane):
     y_m = origin.Y / 1000.0
     z_m = origin.Z / 1000.0
 
-    # Deconstruct Plane: use plane's axes to preserve its rotation
-    x_axis = rg.Vector3d(plane.XAxis); x_axis.Unitize()
-    y_axis = rg.Vector3d(plane.YAxis); y_axis.Unitize()
-    z_axis = rg.Vector3d(plane.ZAxis); z_axis.Unitize()
-    roll_deg, pitch_deg, yaw_deg = _compute_rpy_from_axes(x_axis, y_axis, z_axis)
+    # Deconstruct Plane: use plane's axes to preserve its rotation.
+    # Rhino keeps Plane axes orthonormal, so they are used as-is (no Unitize).
+    roll_deg, pitch_deg, yaw_deg = _compute_rpy_from_axes(plane.XAxis, plane.YAxis, plane.ZAxis)
 
     result = OrderedDict([
         ("motion_type", "moveJ"),
@@ -95,6 +101,56 @@ def plane_to_movej(plane):
     return result
 
 
+def planes_to_movej(planes):
+    """Convert a sequence of Rhino Planes to moveJ dicts in one vectorized pass.
+
+    Same output as calling plane_to_movej per plane. Origins and axes are stacked
+    into arrays and RPY is computed with NumPy; falls back to the per-plane loop
+    when NumPy is not available.
+    """
+    if rg is None:
+        raise RuntimeError("Rhino.Geometry not available. This script is intended for Rhino/Grasshopper.")
+    if np is None:
+        return [plane_to_movej(p) for p in planes]
+    if not planes:
+        return []
+
+    # Columns: origin xyz, XAxis xyz, YAxis xyz, ZAxis z
+    data = np.array([
+        (p.Origin.X, p.Origin.Y, p.Origin.Z,
+         p.XAxis.X, p.XAxis.Y, p.XAxis.Z,
+         p.YAxis.X, p.YAxis.Y, p.YAxis.Z,
+         p.ZAxis.Z)
+        for p in planes
+    ], dtype=float)
+    xyz_m = data[:, 0:3] / 1000.0
+    r11, r21, r31 = data[:, 3], data[:, 4], data[:, 5]
+    r12, r22, r32 = data[:, 6], data[:, 7], data[:, 8]
+    r33 = data[:, 9]
+
+    sy = np.hypot(r11, r21)
+    singular = sy < 1e-9
+
+    # Gimbal lock rows use the alternative yaw and zero roll
+    yaw = np.where(singular, np.arctan2(-r12, r22), np.arctan2(r21, r11)) * _RAD2DEG
+    pitch = np.arctan2(-r31, sy) * _RAD2DEG
+    roll = np.where(singular, 0.0, np.arctan2(r32, r33) * _RAD2DEG)
+
+    rows = np.column_stack((xyz_m, roll, pitch, yaw)).tolist()
+    return [
+        OrderedDict([
+            ("motion_type", "moveJ"),
+            ("x", round(x_m, 3)),
+            ("y", round(y_m, 3)),
+            ("z", round(z_m, 3)),
+            ("roll", round(roll_deg, 3)),
+            ("pitch", round(pitch_deg, 3)),
+            ("yaw", round(yaw_deg, 3)),
+        ])
+        for x_m, y_m, z_m, roll_deg, pitch_deg, yaw_deg in rows
+    ]
+
+
 # Grasshopper convenience: if a variable named `plane` exists in the scope,
 # compute outputs `result` and `movej_command` for direct wiring.
 try:  # noqa: SIM105
@@ -104,3 +160,12 @@ try:  # noqa: SIM105
         movej_command = json.dumps(result, sort_keys=False)
 except NameError:
     pass
+
+# Batch variant: a list input named `planes` yields lists `result` and `movej_command`.
+try:  # noqa: SIM105
+    planes  # type: ignore[name-defined]
+    if planes and rg is not None:
+        result = planes_to_movej(list(planes))  # type: ignore[name-defined]
+        movej_command = [json.dumps(r, sort_keys=False) for r in result]
+except NameError:
+    pass
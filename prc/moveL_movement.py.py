@@ -7,6 +7,8 @@ try:
 except Exception:
     rg = None
 
+_RAD2DEG = 180.0 / math.pi
+
 
 def _compute_rpy_from_axes(x_axis, y_axis, z_axis):
     """Compute roll, pitch, yaw (deg) from right-handed axes using ZYX convention.
@@ -24,17 +26,19 @@ def _compute_rpy_from_axes(x_axis, y_axis, z_axis):
     r32 = y_axis.Z
     r33 = z_axis.Z
 
-    sy = math.sqrt(r11 * r11 + r21 * r21)
+    # hypot of the first column, not sqrt(1 - r31^2): composed plane axes can leave
+    # r31 a few ulps short of +-1 at gimbal lock, which must still read as singular
+    sy = math.hypot(r11, r21)
     singular = sy < 1e-9
 
     if not singular:
-        yaw = math.degrees(math.atan2(r21, r11))
-        pitch = math.degrees(math.atan2(-r31, sy))
-        roll = math.degrees(math.atan2(r32, r33))
+        yaw = math.atan2(r21, r11) * _RAD2DEG
+        pitch = math.atan2(-r31, sy) * _RAD2DEG
+        roll = math.atan2(r32, r33) * _RAD2DEG
     else:
         # Gimbal lock
-        yaw = math.degrees(math.atan2(-r12, r22))
-        pitch = math.degrees(math.atan2(-r31, sy))
+        yaw = math.atan2(-r12, r22) * _RAD2DEG
+        pitch = math.atan2(-r31, sy) * _RAD2DEG
         roll = 0.0
 
     return roll, pitch, yaw
@@ -44,7 +48,7 @@ def _build_axes_from_z(z_axis):
     """Given a Z axis (Vector3d), build a stable right-handed frame (X, Y, Z).
 
     Uses world X as reference; if nearly parallel, switches to world Y.
-    X = Z x refX; Y = Z x X.
+    X = Z x refX; Y = Z x X (already unit: Z and X are unit and orthogonal).
     """
     z = rg.Vector3d(z_axis)
     if not z.Unitize():
@@ -57,7 +61,6 @@ def _build_axes_from_z(z_axis):
     x = rg.Vector3d.CrossProduct(z, ref_x)
     _ = x.Unitize()
     y = rg.Vector3d.CrossProduct(z, x)
-    _ = y.Unitize()
 
     return x, y, z
 
@@ -77,11 +80,9 @@ def plane_to_movel(plane):
     y_m = origin.Y / 1000.0
     z_m = origin.Z / 1000.0
 
-    # Deconstruct Plane: use plane's axes to preserve its rotation
-    x_axis = rg.Vector3d(plane.XAxis); x_axis.Unitize()
-    y_axis = rg.Vector3d(plane.YAxis); y_axis.Unitize()
-    z_axis = rg.Vector3d(plane.ZAxis); z_axis.Unitize()
-    roll_deg, pitch_deg, yaw_deg = _compute_rpy_from_axes(x_axis, y_axis, z_axis)
+    # Deconstruct Plane: use plane's axes to preserve its rotation.
+    # Rhino keeps Plane axes orthonormal, so they are used as-is (no Unitize).
+    roll_deg, pitch_deg, yaw_deg = _compute_rpy_from_axes(plane.XAxis, plane.YAxis, plane.ZAxis)
 
     result = OrderedDict([
         ("motion_type", "moveL"),
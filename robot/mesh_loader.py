@@ -12,16 +12,30 @@ mesh_loader.py - 電池01：網格檔案載入器
 """
 
 import os
+import re
+import math
 
 try:
     import Rhino
     import scriptcontext as sc
-    from Rhino.Geometry import Mesh
+    from Rhino.Geometry import Mesh, MeshFace, Point3f
 except ImportError:
-    Rhino = sc = Mesh = None
+    Rhino = sc = Mesh = MeshFace = Point3f = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 CACHE_KEY = 'GH_ROBOT_MESH_CACHE'
 
+# 二進位 STL 三角形記錄：法向量、三個頂點、屬性位元組（共 50 bytes）
+_STL_RECORD = np.dtype([('n', '<f4', (3,)), ('v', '<f4', (3, 3)), ('attr', '<u2')]) if np else None
+_STL_VERTEX_RE = re.compile(br'vertex\s+(\S+)\s+(\S+)\s+(\S+)')
+
+# 合併頂點後，相鄰面夾角超過此角度的邊重新拆開頂點（保留機構件的硬邊著色）
+_CREASE_ANGLE = math.pi / 8
+
 def _get_cache():
     """取得快取字典"""
     if sc is None:
@@ -43,30 +57,98 @@ def find_mesh_files(dirpath):
     if not dirpath or not os.path.isdir(dirpath):
         return []
 
+    dirpath = os.path.abspath(dirpath)
     files = []
-    for root, _, filenames in os.walk(dirpath):
-        for fn in filenames:
-            if fn.lower().endswith('.stl'):
-                files.append(os.path.abspath(os.path.join(root, fn)))
+
+    # IronPython 2.7 沒有 os.scandir，改用 os.walk
+    if not hasattr(os, 'scandir'):
+        for root, _, filenames in os.walk(dirpath):
+            for fn in filenames:
+                if fn.lower().endswith('.stl'):
+                    files.append(os.path.join(root, fn))
+        return sorted(files)
+
+    # 以堆疊走訪，DirEntry 已帶有檔案類型，不需額外 stat
+    stack = [dirpath]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name[-4:].lower() == '.stl':
+                    files.append(entry.path)
 
     return sorted(files)
 
-def import_mesh_file(filepath):
-    """匯入單一 .stl 檔案並合併所有 mesh"""
-    if not filepath or not os.path.exists(filepath):
-        return None
+def read_stl(filepath):
+    """讀取 .stl 檔案（二進位或 ASCII），回傳三角形頂點陣列 (N, 3, 3)"""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    # 二進位 STL：檔案大小必須符合 84 + 50 * N
+    if len(data) >= 84:
+        count = int(np.frombuffer(data, '<u4', 1, 80)[0])
+        if len(data) == 84 + count * 50:
+            records = np.frombuffer(data, _STL_RECORD, count, 84)
+            return records['v'].astype(np.float64)
+
+    # ASCII STL
+    coords = _STL_VERTEX_RE.findall(data)
+    return np.array(coords, dtype=np.float64).reshape(-1, 3, 3)
+
+
+def _weld_triangles(tris):
+    """合併三角形陣列 (N, 3, 3) 的重複頂點，回傳 (verts (V, 3), faces (F, 3))，F <= N
+
+    STL 每個三角形各自擁有三個頂點，合併後頂點數約降為原本的 1/3，
+    後續 Transform/DuplicateMesh 也隨之變快（不考慮夾角，硬邊由 _mesh_from_arrays 的 Unweld 還原）
+    """
+    pts = tris.reshape(-1, 3)
+
+    # verts 為唯一頂點，inverse 為每個原始頂點對應的索引
+    verts, inverse = np.unique(pts, axis=0, return_inverse=True)
+    faces = inverse.reshape(-1, 3)
+
+    # 原始三角形有重合頂點時，合併後成為 (a, a, b) 退化面：與 Rhino STL 匯入相同，直接剔除
+    f0, f1, f2 = faces[:, 0], faces[:, 1], faces[:, 2]
+    return verts, faces[(f0 != f1) & (f1 != f2) & (f0 != f2)]
+
+
+def _mesh_from_arrays(verts, faces):
+    """以批次 API 由 (verts, faces) 陣列建立 Rhino Mesh
 
+    不另外計算法向量（顯示時 Rhino 會自行計算，且之後的 Transform 也會使其失效）；
+    頂點已合併過，不需要 Compact。_weld_triangles 會合併所有重合頂點，
+    因此以 Unweld 在夾角超過 _CREASE_ANGLE 的邊重新拆開，避免硬邊的法向量被平均
+    """
+    mesh = Mesh()
+    mesh.Vertices.AddVertices([Point3f(x, y, z) for x, y, z in verts.tolist()])
+    mesh.Faces.AddFaces([MeshFace(a, b, c) for a, b, c in faces.tolist()])
+    mesh.Unweld(_CREASE_ANGLE, True)
+    return mesh
+
+
+def _import_with_rhino(filepath):
+    """透過 Rhino 匯入網格檔案並合併所有 mesh
+
+    優先使用 RhinoDoc.Import（不經過指令列解析與 UI 更新），失敗時改用 -_Import 指令
+    """
     doc = Rhino.RhinoDoc.ActiveDoc
     if not doc:
         return None
 
-    cmd = '-_Import "{}" _Enter'.format(filepath.replace('"', '\\"'))
     prev_redraw = doc.Views.RedrawEnabled
     doc.Views.RedrawEnabled = False
 
     try:
         before_ids = set(obj.Id for obj in doc.Objects)
-        Rhino.RhinoApp.RunScript(cmd, False)
+        try:
+            imported = doc.Import(filepath)
+        except Exception:
+            imported = False
+        if not imported:
+            cmd = '-_Import "{}" _Enter'.format(filepath.replace('"', '\\"'))
+            Rhino.RhinoApp.RunScript(cmd, False)
         after_objs = [obj for obj in doc.Objects if obj.Id not in before_ids]
 
         # 提取並合併 mesh
@@ -98,6 +180,43 @@ def import_mesh_file(filepath):
     finally:
         doc.Views.RedrawEnabled = prev_redraw
 
+
+def _load_entry(filepath):
+    """載入單一檔案的快取資料
+
+    .stl（有 numpy 時）直接解析並快取 {'verts', 'faces'} numpy 陣列，
+    Mesh 於第一次使用時才建立；其他格式或解析失敗時透過 Rhino Import，快取 {'mesh': Mesh}
+    """
+    if np is not None and filepath.lower().endswith('.stl'):
+        try:
+            tris = read_stl(filepath)
+            if len(tris):
+                verts, faces = _weld_triangles(tris)
+                return {'verts': verts, 'faces': faces}
+        except Exception:
+            pass
+
+    mesh = _import_with_rhino(filepath)
+    return {'mesh': mesh} if mesh else None
+
+
+def _entry_mesh(entry):
+    """取得快取資料中的共用 Mesh（numpy 陣列於第一次使用時才建立 Mesh）"""
+    mesh = entry.get('mesh')
+    if mesh is None:
+        mesh = _mesh_from_arrays(entry['verts'], entry['faces'])
+        entry['mesh'] = mesh
+    return mesh
+
+
+def import_mesh_file(filepath):
+    """匯入單一網格檔案並合併所有 mesh"""
+    if not filepath or not os.path.exists(filepath):
+        return None
+
+    entry = _load_entry(filepath)
+    return _entry_mesh(entry) if entry else None
+
 def load_meshes(dirpath, recursive, extensions, use_cache):
     """批次載入資料夾中的所有 .stl 檔案"""
     cache = _get_cache()
@@ -107,14 +226,14 @@ def load_meshes(dirpath, recursive, extensions, use_cache):
     paths = []
 
     for fpath in files:
-        cache_key = ('MESH', fpath, os.path.getmtime(fpath))
+        cache_key = ('MESH_DATA', fpath, os.path.getmtime(fpath))
 
-        if cache_key in cache:
-            mesh = cache[cache_key].DuplicateMesh()
-        else:
-            mesh = import_mesh_file(fpath)
-            if mesh:
-                cache[cache_key] = mesh.DuplicateMesh()
+        entry = cache.get(cache_key)
+        if entry is None:
+            entry = _load_entry(fpath)
+            if entry:
+                cache[cache_key] = entry
+        mesh = _entry_mesh(entry) if entry else None
 
         if mesh:
             meshes.append(mesh)
@@ -133,6 +252,8 @@ def load(dirpath, reload=False):
 
     Returns:
         (meshes, paths): Mesh 物件列表與對應的檔案路徑列表
+            Mesh 為快取中的共用物件（不再每次 DuplicateMesh），請勿直接修改；
+            需要修改時請先 DuplicateMesh
     """
     if reload:
         clear_cache()
@@ -5,6 +5,7 @@ urdf_loader.py - 電池02：URDF 運動學引擎
     模擬 RViz 功能 - 解析 URDF visual geometry，計算前向運動學
     支援六軸機器人的關節控制
     自動處理 URDF 中的 xyz、rpy、scale 參數
+    Rhino 以外（CPython + numpy）也可計算前向運動學，回傳 4x4 numpy 矩陣
 
 作者：Avery Tsai
 版本：2.0
@@ -23,50 +24,140 @@ except ImportError:
     sc = None
     Transform = Mesh = Point3d = Vector3d = Plane = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 CACHE_KEY = 'GH_ROBOT_URDF_CACHE'
 
+_DEG2RAD = math.pi / 180.0
+
+if np is not None:
+    _I4 = np.identity(4)           # 共用單位矩陣（唯讀），root link 每次求解直接複製
+    _I4.flags.writeable = False
+
+
 def _parse_floats(s):
-    """解析浮點數字串"""
+    """解析浮點數字串（空白分隔，亦容許逗號）"""
     if not s:
         return []
-    return [float(x) for x in s.strip().replace(',', ' ').split() if x]
+    if ',' in s:
+        s = s.replace(',', ' ')
+    return [float(x) for x in s.split()]
+
+
+def _rpy_matrix(roll, pitch, yaw):
+    """URDF RPY 旋轉矩陣：固定軸旋轉 X(roll) -> Y(pitch) -> Z(yaw)
+
+    直接以 sin/cos 展開 R = Rz(yaw) * Ry(pitch) * Rx(roll)，回傳三列 tuple
+    """
+    sr, cr = math.sin(roll), math.cos(roll)
+    sp, cp = math.sin(pitch), math.cos(pitch)
+    sy, cy = math.sin(yaw), math.cos(yaw)
+    return (
+        (cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr),
+        (sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr),
+        (-sp, cp * sr, cp * cr),
+    )
 
 
 def _rpy_to_transform(roll, pitch, yaw):
-    """URDF RPY 轉換：固定軸旋轉 X(roll) -> Y(pitch) -> Z(yaw)"""
-    origin = Point3d(0, 0, 0)
-    Rx = Transform.Rotation(roll, Vector3d(1, 0, 0), origin)
-    Ry = Transform.Rotation(pitch, Vector3d(0, 1, 0), origin)
-    Rz = Transform.Rotation(yaw, Vector3d(0, 0, 1), origin)
-
-    T = Transform.Identity
-    T = Transform.Multiply(T, Rz)
-    T = Transform.Multiply(T, Ry)
-    T = Transform.Multiply(T, Rx)
+    """URDF RPY 轉換為 Transform（不經過矩陣相乘）"""
+    r0, r1, r2 = _rpy_matrix(roll, pitch, yaw)
+    T = Transform(1.0)
+    T.M00, T.M01, T.M02 = r0
+    T.M10, T.M11, T.M12 = r1
+    T.M20, T.M21, T.M22 = r2
     return T
 
 
 def _xyzrpy_to_transform(xyz, rpy):
-    """xyz + rpy 轉換為 Transform"""
-    T_trans = Transform.Translation(Vector3d(*xyz)) if xyz else Transform.Identity
-    T_rot = _rpy_to_transform(*rpy) if rpy else Transform.Identity
-    return Transform.Multiply(T_trans, T_rot)
+    """xyz + rpy 轉換為 Transform（rpy 為零時只有平移）"""
+    T = _rpy_to_transform(*rpy) if rpy and any(rpy) else Transform(1.0)
+    if xyz:
+        T.M03, T.M13, T.M23 = xyz
+    return T
 
 
-def _axis_angle_transform(axis, angle):
-    """軸角旋轉轉換"""
+def _unit_axis(axis):
+    """關節軸單位向量（零向量回傳 None）"""
     ax = Vector3d(*axis)
     if ax.IsZero:
-        return Transform.Identity
+        return None
     ax.Unitize()
-    return Transform.Rotation(angle, ax, Point3d(0, 0, 0))
+    return ax
+
+
+def _joint_pose_fn(joint):
+    """依關節類型建立 pose(T_parent, q)，前向運動學迴圈不再判斷類型與讀取屬性"""
+    T_origin = joint.T_origin
+    axis_unit = joint.axis_unit
+    multiply = Transform.Multiply
+
+    if joint.type in ('revolute', 'continuous') and axis_unit is not None:
+        # 旋轉關節：繞 axis 旋轉 q 弧度
+        rotation = Transform.Rotation
+        origin = Point3d.Origin
+        return lambda T_parent, q: multiply(multiply(T_parent, T_origin), rotation(q, axis_unit, origin))
+
+    if joint.type == 'prismatic' and axis_unit is not None:
+        # 平移關節：沿 axis 平移 q 距離
+        translation = Transform.Translation
+        return lambda T_parent, q: multiply(multiply(T_parent, T_origin), translation(axis_unit * q))
+
+    # fixed joint（或零向量 axis）不需要額外變換
+    return lambda T_parent, q: multiply(T_parent, T_origin)
+
+
+# -------------------- NumPy 批次運算 --------------------
+
+def _xyzrpy_to_matrix(xyz, rpy):
+    """xyz + rpy 轉換為 4x4 numpy 矩陣"""
+    M = np.identity(4)
+    if rpy and any(rpy):
+        M[:3, :3] = _rpy_matrix(*rpy)
+    if xyz:
+        M[:3, 3] = xyz
+    return M
+
+
+def _rodrigues_batch(axes, angles):
+    """批次軸角旋轉（Rodrigues）：axes (J, 3) 單位向量、angles (J,) -> (J, 4, 4)"""
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    c = np.cos(angles)
+    s = np.sin(angles)
+    t = 1.0 - c
+
+    R = np.zeros((len(angles), 4, 4))
+    R[:, 0, 0] = c + x * x * t
+    R[:, 0, 1] = x * y * t - z * s
+    R[:, 0, 2] = x * z * t + y * s
+    R[:, 1, 0] = y * x * t + z * s
+    R[:, 1, 1] = c + y * y * t
+    R[:, 1, 2] = y * z * t - x * s
+    R[:, 2, 0] = z * x * t - y * s
+    R[:, 2, 1] = z * y * t + x * s
+    R[:, 2, 2] = c + z * z * t
+    R[:, 3, 3] = 1.0
+    return R
+
+
+def _matrix_to_transform(M):
+    """4x4 numpy 矩陣轉換為 Rhino Transform"""
+    r0, r1, r2 = M[:3].tolist()
+    T = Transform(1.0)
+    T.M00, T.M01, T.M02, T.M03 = r0
+    T.M10, T.M11, T.M12, T.M13 = r1
+    T.M20, T.M21, T.M22, T.M23 = r2
+    return T
 
 
 def _normalize_path(path):
     """標準化路徑（用於比對）"""
     if not path:
         return ''
-    return os.path.normpath(os.path.abspath(path)).lower()
+    return os.path.abspath(path).lower().replace('\\', '/')
 
 
 def _get_cache():
@@ -87,10 +178,11 @@ def clear_cache():
 
 class Visual(object):
     """URDF <visual> 元素"""
-    __slots__ = ('mesh_path', 'xyz', 'rpy', 'scale')
+    __slots__ = ('mesh_path', 'norm_path', 'xyz', 'rpy', 'scale')
 
     def __init__(self, mesh_path, xyz, rpy, scale):
         self.mesh_path = mesh_path  # 網格檔案絕對路徑
+        self.norm_path = _normalize_path(mesh_path)  # 標準化路徑（解析時算一次，供配對使用）
         self.xyz = xyz              # [x, y, z]
         self.rpy = rpy              # [roll, pitch, yaw]
         self.scale = scale          # [sx, sy, sz]
@@ -107,7 +199,7 @@ class Link(object):
 
 class Joint(object):
     """URDF <joint> 元素"""
-    __slots__ = ('name', 'type', 'parent', 'child', 'xyz', 'rpy', 'axis')
+    __slots__ = ('name', 'type', 'parent', 'child', 'xyz', 'rpy', 'axis', 'T_origin', 'axis_unit', 'pose')
 
     def __init__(self, name, jtype, parent, child, xyz, rpy, axis):
         self.name = name
@@ -117,17 +209,24 @@ class Joint(object):
         self.xyz = xyz              # [x, y, z]
         self.rpy = rpy              # [roll, pitch, yaw]
         self.axis = axis or [0, 0, 1]  # [x, y, z]
+        self.T_origin = None        # joint origin 變換（解析時預先計算）
+        self.axis_unit = None       # 單位化的 axis（Vector3d，零向量為 None）
+        self.pose = None            # pose(T_parent, q) -> child link 變換（解析時依關節類型建立）
 
 
 class RobotModel(object):
     """URDF 機器人模型"""
-    __slots__ = ('links', 'joints', 'root', 'joint_order')
+    __slots__ = ('links', 'joints', 'root', 'joint_order', 'fk_order', 'fk_links', 'link_ids', 'fk_plan')
 
     def __init__(self):
         self.links = {}         # {name: Link}
         self.joints = {}        # {name: Joint}
         self.root = None        # root link name
         self.joint_order = []   # 可動關節名稱列表（樹狀順序）
+        self.fk_order = []      # [(parent_id, Joint)]，BFS 順序（parent 必在 child 之前）
+        self.fk_links = []      # [root] + 各 fk_order 的 child link 名稱（索引即 link id）
+        self.link_ids = {}      # {link_name: link id}
+        self.fk_plan = None     # FKPlan（有 numpy 時於解析後建立）
 
     def resolve_root(self):
         """找出 root link（沒有 parent 的 link）"""
@@ -136,11 +235,18 @@ class RobotModel(object):
         self.root = candidates[0] if candidates else None
 
     def build_order(self):
-        """建立可動關節的順序（BFS 遍歷）"""
+        """建立可動關節順序與前向運動學遍歷順序（BFS 遍歷）"""
         if not self.root:
             self.resolve_root()
 
+        children_joints = {}
+        for joint in self.joints.values():
+            children_joints.setdefault(joint.parent, []).append(joint)
+
         movable = []
+        fk_order = []
+        fk_links = [self.root]
+        link_ids = {self.root: 0}
         queue = deque([self.root])
         visited = set()
 
@@ -150,13 +256,83 @@ class RobotModel(object):
                 continue
             visited.add(link)
 
-            for joint in self.joints.values():
-                if joint.parent == link:
-                    if joint.type in ('revolute', 'continuous', 'prismatic'):
-                        movable.append(joint.name)
-                    queue.append(joint.child)
+            for joint in children_joints.get(link, []):
+                if joint.type in ('revolute', 'continuous', 'prismatic'):
+                    movable.append(joint.name)
+                fk_order.append((link_ids[link], joint))
+                link_ids[joint.child] = len(fk_links)
+                fk_links.append(joint.child)
+                queue.append(joint.child)
 
         self.joint_order = movable
+        self.fk_order = fk_order
+        self.fk_links = fk_links
+        self.link_ids = link_ids
+
+
+class FKPlan(object):
+    """扁平化的前向運動學計畫
+
+    將 fk_order 中不隨關節值改變的 URDF 常數整理為 numpy 陣列（解析後建立一次），
+    每次求解只剩關節運動與矩陣連乘
+    """
+    __slots__ = ('links', 'link_index', 'joint_names', 'origins', 'axes',
+                 'revolute', 'prismatic', 'parents', 'scratch')
+
+    def __init__(self, robot):
+        n = len(robot.fk_order)
+        self.links = robot.fk_links             # [root] + 各 fk_order 的 child link 名稱
+        self.link_index = robot.link_ids        # {link_name: links 中的索引}
+        self.joint_names = []                   # fk_order 的關節名稱
+        self.origins = np.empty((n, 4, 4))      # (J, 4, 4) joint origin 矩陣
+        self.axes = np.zeros((n, 3))            # (J, 3) 單位化的 axis
+        self.revolute = np.zeros(n, dtype=bool)     # (J,) 旋轉關節遮罩
+        self.prismatic = np.zeros(n, dtype=bool)    # (J,) 平移關節遮罩
+        self.parents = np.zeros(n, dtype=np.int64)  # (J,) parent link 在 links 中的索引
+        self.scratch = np.zeros((n + 1, 4, 4))      # solve(reuse=True) 重複使用的輸出緩衝區
+
+        for i, (parent_id, joint) in enumerate(robot.fk_order):
+            self.parents[i] = parent_id
+            self.joint_names.append(joint.name)
+
+            self.origins[i] = _xyzrpy_to_matrix(joint.xyz, joint.rpy)
+            axis = np.array(joint.axis[:3], dtype=float)
+            norm = np.sqrt(axis.dot(axis))
+            if norm == 0.0:
+                continue  # 零向量 axis：視同 fixed
+            self.axes[i] = axis / norm
+            self.revolute[i] = joint.type in ('revolute', 'continuous')
+            self.prismatic[i] = joint.type == 'prismatic'
+
+    def solve(self, joint_values, reuse=False):
+        """計算所有 link 的世界矩陣
+
+        有 numba 時使用編譯後的 _fk_kernel，否則以 numpy 批次運算
+
+        Args:
+            joint_values: dict {joint_name: value_in_radians}
+            reuse: True 時寫入 self.scratch（下次求解會覆寫，呼叫端須立即取用）
+
+        Returns:
+            (L, 4, 4) numpy 陣列，索引對應 self.links
+        """
+        q = np.array([joint_values.get(name, 0.0) for name in self.joint_names], dtype=float)
+        out = self.scratch if reuse else np.zeros((len(q) + 1, 4, 4))
+
+        kernel = _compiled_fk_kernel()
+        if kernel is not None:
+            kernel(self.origins, self.axes, self.revolute, self.prismatic, self.parents, q, out)
+            return out
+
+        # 關節運動：旋轉關節以 Rodrigues 批次計算，平移關節寫入平移欄
+        motion = _rodrigues_batch(self.axes, np.where(self.revolute, q, 0.0))
+        motion[:, :3, 3] = self.axes * np.where(self.prismatic, q, 0.0)[:, None]
+        local = np.matmul(self.origins, motion)
+
+        out[0] = _I4
+        for i, p in enumerate(self.parents.tolist()):
+            out[i + 1] = out[p].dot(local[i])
+        return out
 
 def _resolve_mesh_path(filename, base_dir, urdf_root):
     """解析網格檔案路徑
@@ -192,11 +368,16 @@ def _resolve_mesh_path(filename, base_dir, urdf_root):
 
 
 def parse_urdf(urdf_path):
-    """解析 URDF 檔案（只處理 <visual><geometry>）"""
+    """解析 URDF 檔案（只處理 <visual><geometry>）
+
+    快取以檔案修改時間驗證：URDF 被編輯後下次求解會自動重新解析，不需 Reload
+    """
     cache = _get_cache()
-    cache_key = ('URDF', urdf_path)
-    if cache_key in cache:
-        return cache[cache_key]
+    cache_key = ('URDF_MTIME', urdf_path)   # 值為 (mtime, robot)
+    mtime = os.path.getmtime(urdf_path)
+    entry = cache.get(cache_key)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
 
     tree = ET.parse(urdf_path)
     root = tree.getroot()
@@ -205,58 +386,72 @@ def parse_urdf(urdf_path):
     base_dir = os.path.dirname(urdf_path)
     urdf_root = os.path.abspath(os.path.join(base_dir, '..'))
 
-    # 解析 links（只處理 <visual>）
-    for link_elem in root.findall('link'):
-        link_name = link_elem.get('name')
-        link = Link(link_name)
-
-        for visual_elem in link_elem.findall('visual'):
-            # 解析 origin
-            origin_elem = visual_elem.find('origin')
-            xyz = _parse_floats(origin_elem.get('xyz')) if origin_elem is not None else [0, 0, 0]
-            rpy = _parse_floats(origin_elem.get('rpy')) if origin_elem is not None else [0, 0, 0]
-
-            # 解析 geometry/mesh
-            geom_elem = visual_elem.find('geometry')
-            mesh_elem = geom_elem.find('mesh') if geom_elem is not None else None
-
-            if mesh_elem is not None:
-                mesh_file = mesh_elem.get('filename')
-                mesh_path = _resolve_mesh_path(mesh_file, base_dir, urdf_root) if mesh_file else None
-
-                # 解析 scale（預設 [1, 1, 1]）
-                scale = _parse_floats(mesh_elem.get('scale')) or [1.0, 1.0, 1.0]
-                scale = (scale + [1.0, 1.0, 1.0])[:3]  # 確保長度為 3
-
-                link.visuals.append(Visual(mesh_path, xyz, rpy, scale))
-
-        robot.links[link_name] = link
-
-    # 解析 joints
-    for joint_elem in root.findall('joint'):
-        joint_name = joint_elem.get('name')
-        joint_type = joint_elem.get('type')
-        parent_link = joint_elem.find('parent').get('link')
-        child_link = joint_elem.find('child').get('link')
-
-        # 解析 origin
-        origin_elem = joint_elem.find('origin')
-        xyz = _parse_floats(origin_elem.get('xyz')) if origin_elem is not None else [0, 0, 0]
-        rpy = _parse_floats(origin_elem.get('rpy')) if origin_elem is not None else [0, 0, 0]
-
-        # 解析 axis
-        axis_elem = joint_elem.find('axis')
-        axis = _parse_floats(axis_elem.get('xyz')) if axis_elem is not None else [0, 0, 1]
-
-        joint = Joint(joint_name, joint_type, parent_link, child_link, xyz, rpy, axis)
-        robot.joints[joint_name] = joint
+    # 單次遍歷 root 的子元素，依 tag 分派 link / joint
+    for elem in root:
+        if elem.tag == 'link':
+            link_name = elem.get('name')
+            link = Link(link_name)
+
+            # 只處理 <visual>
+            for visual_elem in elem:
+                if visual_elem.tag != 'visual':
+                    continue
+
+                # 解析 origin
+                origin_elem = visual_elem.find('origin')
+                xyz = _parse_floats(origin_elem.get('xyz')) if origin_elem is not None else [0, 0, 0]
+                rpy = _parse_floats(origin_elem.get('rpy')) if origin_elem is not None else [0, 0, 0]
+
+                # 解析 geometry/mesh
+                geom_elem = visual_elem.find('geometry')
+                mesh_elem = geom_elem.find('mesh') if geom_elem is not None else None
+
+                if mesh_elem is not None:
+                    mesh_file = mesh_elem.get('filename')
+                    mesh_path = _resolve_mesh_path(mesh_file, base_dir, urdf_root) if mesh_file else None
+
+                    # 解析 scale（預設 [1, 1, 1]）
+                    scale = _parse_floats(mesh_elem.get('scale')) or [1.0, 1.0, 1.0]
+                    scale = (scale + [1.0, 1.0, 1.0])[:3]  # 確保長度為 3
+
+                    link.visuals.append(Visual(mesh_path, xyz, rpy, scale))
+
+            robot.links[link_name] = link
+
+        elif elem.tag == 'joint':
+            parent_link = child_link = None
+            xyz, rpy, axis = [0, 0, 0], [0, 0, 0], [0, 0, 1]
+
+            # 直接依 tag 讀取子元素，不重複 find
+            for child in elem:
+                tag = child.tag
+                if tag == 'parent':
+                    parent_link = child.get('link')
+                elif tag == 'child':
+                    child_link = child.get('link')
+                elif tag == 'origin':
+                    xyz = _parse_floats(child.get('xyz'))
+                    rpy = _parse_floats(child.get('rpy'))
+                elif tag == 'axis':
+                    axis = _parse_floats(child.get('xyz'))
+
+            joint_name = elem.get('name')
+            joint = Joint(joint_name, elem.get('type'), parent_link, child_link, xyz, rpy, axis)
+            # URDF 常數：預先計算，前向運動學時直接使用（Rhino 以外改用 numpy 陣列）
+            if Transform is not None:
+                joint.T_origin = _xyzrpy_to_transform(joint.xyz, joint.rpy)
+                joint.axis_unit = _unit_axis(joint.axis)
+                joint.pose = _joint_pose_fn(joint)
+            robot.joints[joint_name] = joint
 
     # 建立機器人樹結構
     robot.resolve_root()
     robot.build_order()
+    if np is not None:
+        robot.fk_plan = FKPlan(robot)
 
-    # 快取結果
-    cache[cache_key] = robot
+    # 快取結果（連同修改時間）
+    cache[cache_key] = (mtime, robot)
     return robot
 
 
@@ -265,112 +460,208 @@ def parse_urdf(urdf_path):
 
 # -------------------- Kinematics --------------------
 
-def compute_link_transforms(robot, joint_values):
+def compute_link_transforms(robot, joint_values, link_names=None):
     """計算所有 link 的世界座標變換（前向運動學）
 
     Args:
         robot: RobotModel 實例
         joint_values: dict {joint_name: value_in_radians}
+        link_names: 只需要這些 link 時傳入（只回傳這些 link；FKPlan 路徑只轉換這些 Transform）
 
     Returns:
-        dict {link_name: Transform}
+        dict {link_name: Transform}（Rhino 以外為 {link_name: 4x4 numpy 矩陣}）
     """
     T_world = {}
     if not robot.root:
         return T_world
 
-    # Root link 的變換為單位矩陣
-    T_world[robot.root] = Transform.Identity
-
-    # 建立 parent -> children joints 的映射
-    children_joints = {}
-    for joint in robot.joints.values():
-        children_joints.setdefault(joint.parent, []).append(joint)
-
-    def traverse(link_name):
-        """遞迴遍歷機器人樹"""
-        for joint in children_joints.get(link_name, []):
-            # 取得 parent link 的變換
-            T_parent = T_world[link_name]
-
-            # 套用 joint origin 變換（xyz + rpy）
-            T_joint_origin = _xyzrpy_to_transform(joint.xyz, joint.rpy)
-            T = Transform.Multiply(T_parent, T_joint_origin)
-
-            # 套用關節運動（revolute/continuous/prismatic）
-            joint_value = joint_values.get(joint.name, 0.0)
-            if joint.type in ('revolute', 'continuous'):
-                # 旋轉關節：繞 axis 旋轉 joint_value 弧度
-                T_rotation = _axis_angle_transform(joint.axis, joint_value)
-                T = Transform.Multiply(T, T_rotation)
-            elif joint.type == 'prismatic':
-                # 平移關節：沿 axis 平移 joint_value 距離
-                axis_vec = Vector3d(*joint.axis)
-                axis_vec.Unitize()
-                T_translation = Transform.Translation(axis_vec * joint_value)
-                T = Transform.Multiply(T, T_translation)
-            # fixed joint 不需要額外變換
-
-            # 儲存 child link 的變換
-            T_world[joint.child] = T
-
-            # 遞迴處理子節點
-            traverse(joint.child)
-
-    traverse(robot.root)
-    return T_world
-
-def normalize_path(p):
-    """Normalize path for comparison"""
-    if not p:
-        return ''
-    return os.path.abspath(p).lower().replace('\\', '/')
+    plan = robot.fk_plan
+    if plan is not None:
+        if Transform is None:
+            return dict(zip(plan.links, plan.solve(joint_values)))
+        # 立即轉換為 Transform，可直接使用 plan 的輸出緩衝區
+        M_world = plan.solve(joint_values, reuse=True)
+        if link_names is None:
+            link_names = plan.links
+        index = plan.link_index
+        return {name: _matrix_to_transform(M_world[index[name]]) for name in link_names if name in index}
+
+    # Root link 的變換為單位矩陣；依 fk_order 以 link id 索引逐一計算（parent 一定先於 child），
+    # joint origin 與關節運動已於解析時合成為 joint.pose
+    T_list = [Transform.Identity]
+    get = joint_values.get
+    for parent_id, joint in robot.fk_order:
+        T_list.append(joint.pose(T_list[parent_id], get(joint.name, 0.0)))
+
+    if link_names is None:
+        return dict(zip(robot.fk_links, T_list))
+    ids = robot.link_ids
+    return {name: T_list[ids[name]] for name in link_names if name in ids}
+
+def _fk_kernel(origins, axes, revolute, prismatic, parents, q, out):
+    """前向運動學核心迴圈（純量運算，可由 numba 編譯）
+
+    結果寫入 out (J+1, 4, 4)：索引 0 為 root，索引 i+1 為 fk_order[i] 的 child link
+    （只寫入上面三列與 [3, 3]，out 最下列其餘元素須為 0）
+    """
+    n = q.shape[0]
+    for r in range(4):
+        for k in range(4):
+            out[0, r, k] = 1.0 if r == k else 0.0
+
+    M = np.zeros((4, 4))
+    L = np.zeros((4, 4))
+    M[3, 3] = 1.0
+    L[3, 3] = 1.0
+    for i in range(n):
+        # 關節運動：Rodrigues 旋轉 + 沿 axis 平移（固定關節兩者皆為 0）
+        x, y, z = axes[i, 0], axes[i, 1], axes[i, 2]
+        a = q[i] if revolute[i] else 0.0
+        d = q[i] if prismatic[i] else 0.0
+        c = math.cos(a)
+        s = math.sin(a)
+        t = 1.0 - c
+        M[0, 0] = c + x * x * t
+        M[0, 1] = x * y * t - z * s
+        M[0, 2] = x * z * t + y * s
+        M[0, 3] = x * d
+        M[1, 0] = y * x * t + z * s
+        M[1, 1] = c + y * y * t
+        M[1, 2] = y * z * t - x * s
+        M[1, 3] = y * d
+        M[2, 0] = z * x * t - y * s
+        M[2, 1] = z * y * t + x * s
+        M[2, 2] = c + z * z * t
+        M[2, 3] = z * d
+
+        # L = origin @ M；child = parent @ L
+        # 皆為剛體變換：最下列固定為 [0, 0, 0, 1]，只計算上面三列（乘法 64 -> 36）
+        for r in range(3):
+            for k in range(4):
+                acc = 0.0
+                for m in range(3):
+                    acc += origins[i, r, m] * M[m, k]
+                if k == 3:
+                    acc += origins[i, r, 3]
+                L[r, k] = acc
+        p = parents[i]
+        for r in range(3):
+            for k in range(4):
+                acc = 0.0
+                for m in range(3):
+                    acc += out[p, r, m] * L[m, k]
+                if k == 3:
+                    acc += out[p, r, 3]
+                out[i + 1, r, k] = acc
+        out[i + 1, 3, 3] = 1.0
+
+
+_fk_kernel_jit = None   # numba 編譯結果（None：尚未嘗試，False：無 numba）
+
+
+def _compiled_fk_kernel():
+    """取得 numba 編譯後的 _fk_kernel；numba 延後到第一次計算時才匯入
+
+    匯入 numba 需要數百毫秒，放在模組層級會拖慢每次 `import robot`
+    """
+    global _fk_kernel_jit
+    if _fk_kernel_jit is None:
+        try:
+            from numba import njit
+            _fk_kernel_jit = njit(cache=True)(_fk_kernel)
+        except ImportError:
+            _fk_kernel_jit = False
+    return _fk_kernel_jit or None
 
 
 def match_meshes(robot, input_meshes, input_paths):
     """將網格與 URDF visual geometry 配對"""
     path_to_mesh = {}
-    for i, path in enumerate(input_paths or []):
-        if i < len(input_meshes):
-            path_to_mesh[normalize_path(path)] = input_meshes[i]
+    for path, mesh in zip(input_paths or [], input_meshes or []):
+        path_to_mesh[_normalize_path(path)] = mesh
 
     link_meshes = {}
     for link_name, link in robot.links.items():
         link_meshes[link_name] = []
         for visual in link.visuals:
-            mesh = path_to_mesh.get(normalize_path(visual.mesh_path))
+            mesh = path_to_mesh.get(visual.norm_path)
             if mesh:
                 link_meshes[link_name].append((mesh, visual))
 
     return link_meshes
 
 
-def assemble_geometry(robot, T_links, link_meshes):
-    """組裝機器人幾何（套用變換：scale → visual origin → link transform）"""
-    out_meshes = []
-    out_names = []
-
+def bake_meshes(robot, link_meshes):
+    """預先套用 scale 與 visual origin（URDF 常數），回傳 [(baked_mesh, link_name)]"""
+    baked = []
     for link_name in robot.links.keys():
-        T_link = T_links.get(link_name, Transform.Identity)
-
         for mesh, visual in link_meshes.get(link_name, []):
+            # scale → visual origin 合成為單一變換
+            T_visual = _xyzrpy_to_transform(visual.xyz, visual.rpy)
+            if visual.scale != [1.0, 1.0, 1.0]:
+                T_scale = Transform.Scale(Plane.WorldXY, visual.scale[0], visual.scale[1], visual.scale[2])
+                T_visual = Transform.Multiply(T_visual, T_scale)
+
             m = mesh.DuplicateMesh()
+            m.Transform(T_visual)
+            baked.append((m, link_name))
+
+    return baked
 
-            # 1. Scale
-            if visual.scale != [1.0, 1.0, 1.0]:
-                m.Transform(Transform.Scale(Plane.WorldXY, visual.scale[0], visual.scale[1], visual.scale[2]))
 
-            # 2. Visual origin
-            m.Transform(_xyzrpy_to_transform(visual.xyz, visual.rpy))
+def _get_baked_meshes(urdf_path, robot, meshes, mesh_paths):
+    """取得預先烘焙的網格（URDF、輸入網格與路徑皆未變時直接使用快取）"""
+    cache = _get_cache()
+    cache_key = ('BAKED_MESHES', urdf_path)   # 值為 (robot, meshes, mesh_paths, baked)
 
-            # 3. Link transform
-            m.Transform(T_link)
+    entry = cache.get(cache_key)
+    if entry is not None:
+        in_robot, in_meshes, in_paths, baked = entry
+        if (in_robot is robot and in_paths == mesh_paths and len(in_meshes) == len(meshes)
+                and all(a is b for a, b in zip(in_meshes, meshes))):
+            return baked
 
-            out_meshes.append(m)
-            out_names.append(link_name)
+    baked = bake_meshes(robot, match_meshes(robot, meshes, mesh_paths))
+    cache[cache_key] = (robot, meshes, mesh_paths, baked)
+    return baked
+
+
+def assemble_geometry(T_links, baked_meshes, posed=None):
+    """組裝機器人幾何（烘焙網格只需再套用 link transform）
+
+    posed: 上次的 [(T_link, mesh)]（與 baked_meshes 對齊），link transform 未變時沿用上次的網格
+    """
+    out_meshes = []
+    out_names = []
+
+    identity = Transform.Identity
+    for i, (baked, link_name) in enumerate(baked_meshes):
+        T = T_links.get(link_name, identity)
+        prev = posed[i] if posed is not None else None
+        if prev is not None and prev[0].Equals(T):
+            m = prev[1]
+        else:
+            m = baked.DuplicateMesh()
+            m.Transform(T)
+            if posed is not None:
+                posed[i] = (T, m)
+        out_meshes.append(m)
+        out_names.append(link_name)
 
     return out_meshes, out_names
 
+
+def _get_posed_slots(urdf_path, baked):
+    """取得與烘焙網格對應的姿態快取槽（烘焙網格重建時一併清空）"""
+    cache = _get_cache()
+    cache_key = ('POSED', urdf_path)
+
+    entry = cache.get(cache_key)
+    if entry is None or entry[0] is not baked:
+        entry = (baked, [None] * len(baked))
+        cache[cache_key] = entry
+    return entry[1]
+
 def load(urdf_path, meshes, mesh_paths, joint_values=None, use_degrees=True, reload=False):
     """載入 URDF 並計算運動學
 
@@ -396,24 +687,29 @@ def load(urdf_path, meshes, mesh_paths, joint_values=None, use_degrees=True, rel
     except:
         return [], [], []
 
-    # 處理關節值
-    j_vals = list(joint_values) if joint_values else [0.0] * 6
-    j_vals = (j_vals + [0.0] * 6)[:6]
+    # 處理關節值（弧度，不足六軸補 0；第七軸以後由 FK 視為 0）
+    n = len(joint_values) if joint_values else 0
+    scale = _DEG2RAD if use_degrees else 1.0
+    joints = tuple(joint_values[i] * scale if i < n else 0.0 for i in range(6))
+
+    baked = _get_baked_meshes(urdf_path, robot, list(meshes or []), list(mesh_paths or []))
 
-    if use_degrees:
-        j_vals = [math.radians(v) for v in j_vals]
+    # 關節值、URDF 與網格皆未變（只有其他輸入觸發重算）時直接回傳上次結果
+    cache = _get_cache()
+    solve_key = ('SOLVE', urdf_path)
+    last = cache.get(solve_key)
+    if last is not None and last[0] is baked and last[1] == joints:
+        return list(last[2]), list(last[3]), robot.joint_order[:6]
 
     # 建立關節值字典
-    joint_dict = {}
-    for i, jname in enumerate(robot.joint_order):
-        joint_dict[jname] = j_vals[i] if i < 6 else 0.0
+    joint_dict = dict(zip(robot.joint_order[:6], joints))
 
-    # 計算運動學
-    T_links = compute_link_transforms(robot, joint_dict)
-    link_meshes = match_meshes(robot, meshes or [], mesh_paths or [])
-    result_meshes, names = assemble_geometry(robot, T_links, link_meshes)
+    # 計算運動學（只轉換有網格的 link）
+    T_links = compute_link_transforms(robot, joint_dict, {name for _, name in baked})
+    result_meshes, names = assemble_geometry(T_links, baked, _get_posed_slots(urdf_path, baked))
+    cache[solve_key] = (baked, joints, result_meshes, names)
 
-    return result_meshes, names, robot.joint_order[:6]
+    return list(result_meshes), list(names), robot.joint_order[:6]
 
 
 # 向後相容
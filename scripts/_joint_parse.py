@@ -0,0 +1,169 @@
+"""
+Shared joint-trajectory parsing for the JSON -> JSONL tools.
+
+Used by convert_joint_json_to_jsonl.py (CLI) and gh_traj_loader.py (Grasshopper)
+so both produce the same joint1..joint6 rows from the same shapes:
+
+  A) {"joint_states": [ {"name": [...], "position": [...]}, ... ]}
+  B) [ {"name": [...], "position": [...]}, ... ]
+  C) {"joint_names": [...], "points": [ {"positions": [...]}, ... ]}
+
+If names are present, values are mapped to joint1..joint6 by matching normalized
+names like joint_1 / joint1. Otherwise the first 6 positions are taken in order.
+Missing joints are padded with 0.0.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Fixed JSONL row schema; %r is the shortest round-trip float repr (same digits as json.dumps)
+ROW_FMT = '{"joint1":%r,"joint2":%r,"joint3":%r,"joint4":%r,"joint5":%r,"joint6":%r}'
+
+Frame = Tuple[float, float, float, float, float, float]
+
+
+def format_row(row: Frame) -> str:
+    """Format one JSONL row, writing non-finite values as NaN/Infinity like json.dumps.
+
+    %r gives nan/inf, which no JSON parser reads back; the joint keys contain neither substring.
+    """
+    line = ROW_FMT % row
+    if 'nan' in line or 'inf' in line:
+        line = line.replace('nan', 'NaN').replace('inf', 'Infinity')
+    return line
+
+
+# One translate pass: ASCII upper -> lower, drop underscores. Only the ASCII
+# targets joint1..joint6 are ever matched, so ASCII-only lowercasing is enough.
+_NORM_TAB = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz', '_')
+
+
+def normalize_name(name: Any) -> str:
+    # Lowercase and remove underscores; focus on patterns like joint_1 -> joint1
+    try:
+        return str(name).strip().translate(_NORM_TAB)
+    except Exception:
+        return ''
+
+
+def build_name_index(names: List[Any]) -> Dict[str, int]:
+    """Map normalized name -> first position index, built once per names list."""
+    index: Dict[str, int] = {}
+    for i, n in enumerate(names or []):
+        index.setdefault(normalize_name(n), i)
+    return index
+
+
+def pick_value_by_name(name_idx: Dict[str, int], positions: List[float], j_index: int) -> float:
+    """Try to pick value for joint{j_index} via the normalized-name index.
+    Fallback: if not found and positions has enough elements, use positions[j_index-1]; else 0.0
+    """
+    i = name_idx.get(f'joint{j_index}')
+    if i is not None:
+        return float(positions[i]) if i < len(positions) else 0.0
+    # Fallback by index (1-based -> 0-based)
+    if len(positions) >= j_index:
+        return float(positions[j_index - 1])
+    return 0.0
+
+
+def joint_columns(names: List[Any]) -> List[int]:
+    """Resolve the position column for joint1..joint6 once per names list.
+
+    Same rules as pick_value_by_name: first normalized-name match, else the
+    joint's 1-based index. A column beyond the positions row reads as 0.0.
+    """
+    name_idx = build_name_index(names)
+    return [name_idx.get(f'joint{j}', j - 1) for j in range(1, 7)]
+
+
+def select_columns(rows: List[List[Any]], cols: List[int]) -> List[List[float]]:
+    """Pick `cols` from every positions row, padding short rows with 0.0."""
+    width = max(cols) + 1
+    if np is not None and rows:
+        arr = np.zeros((len(rows), width), dtype=np.float64)
+        for r, positions in enumerate(rows):
+            n = min(len(positions), width)
+            arr[r, :n] = positions[:n]
+        return arr[:, cols].tolist()
+    return [[float(p[c]) if c < len(p) else 0.0 for c in cols] for p in rows]
+
+
+def _is_shape_c(obj: Any) -> bool:
+    return isinstance(obj, dict) and isinstance(obj.get('points'), list)
+
+
+def _is_shape_a(obj: Any) -> bool:
+    return isinstance(obj, dict)
+
+
+def _is_shape_b(obj: Any) -> bool:
+    return isinstance(obj, list)
+
+
+def _parse_shape_c(obj: Dict[str, Any]) -> List[Frame]:
+    """Shape C: joint_names + points."""
+    names = obj.get('joint_names') or obj.get('names') or []
+    names = list(names) if isinstance(names, (list, tuple)) else []
+    rows = []
+    for pt in obj['points']:
+        if not isinstance(pt, dict):
+            continue
+        positions = pt.get('positions') or pt.get('position') or []
+        rows.append(positions if isinstance(positions, (list, tuple)) else [])
+
+    # Name matching is the same for every point: resolve the columns once
+    return [tuple(jvals) for jvals in select_columns(rows, joint_columns(names))]
+
+
+def _parse_shape_a(obj: Dict[str, Any]) -> List[Frame]:
+    """Shape A: joint_states list (or the first list-like value of the dict)."""
+    seq = obj.get('joint_states')
+    if not isinstance(seq, list):
+        seq = next((v for v in obj.values() if isinstance(v, list)), None)
+    return _parse_shape_b(seq) if seq else []
+
+
+def _parse_shape_b(seq: List[Any]) -> List[Frame]:
+    """Shape B: plain list of {"name": [...], "position": [...]} entries."""
+    frames: List[Frame] = []
+    for entry in seq:
+        if not isinstance(entry, dict):
+            continue
+        names = entry.get('name') or entry.get('names') or []
+        positions = entry.get('position') or entry.get('positions') or []
+        if not isinstance(names, (list, tuple)):
+            names = []
+        if not isinstance(positions, (list, tuple)):
+            positions = []
+
+        name_idx = build_name_index(names)
+        frames.append((
+            pick_value_by_name(name_idx, positions, 1),
+            pick_value_by_name(name_idx, positions, 2),
+            pick_value_by_name(name_idx, positions, 3),
+            pick_value_by_name(name_idx, positions, 4),
+            pick_value_by_name(name_idx, positions, 5),
+            pick_value_by_name(name_idx, positions, 6),
+        ))
+    return frames
+
+
+# (predicate, handler) in priority order; a new shape is one more entry
+_SHAPES = [
+    (_is_shape_c, _parse_shape_c),
+    (_is_shape_a, _parse_shape_a),
+    (_is_shape_b, _parse_shape_b),
+]
+
+
+def parse_frames(obj: Any) -> List[Frame]:
+    """Parse the supported trajectory JSON shapes into (joint1..joint6) tuples."""
+    for is_shape, parse in _SHAPES:
+        if is_shape(obj):
+            return parse(obj)
+    return []
@@ -6,162 +6,158 @@ Convert ROS JointState JSON to JSONL with fields joint1..joint6.
 - Output default: ./config/joints.jsonl
 
 The script is conservative and keeps the numeric values as-is (typically radians).
-It tries to parse common shapes:
-  1) {"joint_states": [ {"name": [...], "position": [...], ...}, ... ]}
-  2) [ {"name": [...], "position": [...], ...}, ... ]
+The supported shapes and joint-name matching live in _joint_parse.py, shared
+with gh_traj_loader.py.
 
-If names are present, it maps values to joint1..joint6 by matching normalized
-names like joint_1 / joint1. Otherwise it takes the first 6 positions in order.
-Missing joints are padded with 0.0.
+With ijson installed, {"joint_names": [...], "points": [...]} files are streamed
+point by point so memory does not grow with the trajectory length.
 """
 
 import os
 import sys
 import json
 import argparse
-from typing import Any, Dict, List, Tuple
+from typing import Any, List, Optional
+
+from _joint_parse import Frame, format_row, joint_columns, parse_frames
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Shape C falls back to the in-memory path
+    ijson = None
 
 DEFAULT_IN  = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'output.json')
 DEFAULT_OUT = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'jjjj.jsonl')
 
+WRITE_BATCH = 4096  # rows joined per f.write call
+
 
 def read_json(path: str) -> Any:
-    # UTF-8 first, then fallback to UTF-8-sig
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except ValueError:
-        with open(path, 'r', encoding='utf-8-sig') as f:
-            return json.load(f)
+    # Read bytes once and drop a UTF-8 BOM (orjson rejects it; json would need utf-8-sig)
+    with open(path, 'rb') as f:
+        buf = f.read()
+    if buf[:3] == b'\xef\xbb\xbf':
+        buf = buf[3:]
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals written by json.dump: only the stdlib accepts them
+    return json.loads(buf.decode('utf-8'))
+
+
+def write_jsonl(path: str, rows: List[Frame]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for start in range(0, len(rows), WRITE_BATCH):
+            chunk = rows[start:start + WRITE_BATCH]
+            f.write('\n'.join([format_row(row) for row in chunk]))
+            f.write('\n')
+
 
+def _open_json_bytes(path: str):
+    """Open `path` for ijson, positioned after a UTF-8 BOM if there is one."""
+    f = open(path, 'rb')
+    if f.read(3) != b'\xef\xbb\xbf':
+        f.seek(0)
+    return f
 
-def normalize_name(name: str) -> str:
-    # Lowercase and remove underscores; focus on patterns like joint_1 -> joint1
-    if not isinstance(name, str):
-        return ''
-    return name.strip().lower().replace('_', '')
 
+# Top-level keys allowed before "points" in a streamed Shape C file (small values).
+# Any other top-level container decides the shape check early: such files take the
+# in-memory path, which handles every shape, instead of scanning on for "points".
+_SHAPE_C_PREAMBLE = ('joint_names', 'names', 'header')
 
-def pick_value_by_name(names: List[str], positions: List[float], j_index: int) -> float:
-    """Try to pick value for joint{j_index} by matching normalized names.
-    Fallback: if not found and positions has enough elements, use positions[j_index-1]; else 0.0
+
+def _is_shape_c(path: str) -> bool:
+    """True when the top-level object has a "points" array (checked via parse events).
+
+    Stops at the first decisive event, so Shape A/B files are not scanned in full.
     """
-    target = f'joint{j_index}'
-    try:
-        norm = [normalize_name(n) for n in names]
-        for i, n in enumerate(norm):
-            if n == target:
-                return float(positions[i]) if i < len(positions) else 0.0
-    except Exception:
-        pass
-    # Fallback by index (1-based -> 0-based)
-    if len(positions) >= j_index:
-        return float(positions[j_index - 1])
-    return 0.0
-
-
-def ensure_six(values: List[float]) -> List[float]:
-    vals = list(values[:6])
-    if len(vals) < 6:
-        vals += [0.0] * (6 - len(vals))
-    return vals
-
-
-def parse_frames(obj: Any) -> Tuple[List[Dict[str, float]], int]:
-    """Parse various joint trajectory JSON shapes into rows of joint1..joint6.
-
-    Supported shapes:
-      A) {"joint_states": [ {"name": [...], "position": [...]}, ... ]}
-      B) [ {"name": [...], "position": [...]}, ... ]
-      C) {"joint_names": [...], "points": [ {"positions": [...]}, ... ]}
+    with _open_json_bytes(path) as f:
+        events = ijson.parse(f)
+        prefix, event, _ = next(events)
+        if event != 'start_map':
+            return False
+        key = None
+        for prefix, event, value in events:
+            if key is not None:
+                # First event of a top-level value
+                if key == 'points':
+                    return event == 'start_array'
+                if event in ('start_array', 'start_map') and key not in _SHAPE_C_PREAMBLE:
+                    return False
+                key = None
+            elif prefix == '' and event == 'map_key':
+                key = value
+    return False
+
+
+def _stream_item(path: str, prefix: str) -> Any:
+    with _open_json_bytes(path) as f:
+        return next(ijson.items(f, prefix, use_float=True), None)
+
+
+def _has_nonfinite_literal(path: str) -> bool:
+    """True when the file contains NaN/Infinity (json.dump writes them; ijson rejects them)."""
+    tail = b''
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            buf = tail + block
+            if b'NaN' in buf or b'Infinity' in buf:
+                return True
+            tail = buf[-7:]
+    return False
+
+
+def parse_and_stream(input_path: str, output_path: str) -> Optional[int]:
+    """Convert a Shape C file point by point with ijson, writing each row immediately.
+
+    Memory stays bounded regardless of trajectory length. Rows go to a temporary
+    file next to the output, which replaces output_path only once the whole input
+    has been converted; on error the previous output is left untouched.
+    Returns the number of rows written, or None when ijson is unavailable or the
+    input is not Shape C (the caller then uses read_json/parse_frames).
     """
-    frames: List[Dict[str, float]] = []
-
-    # Shape C: joint_names + points
-    if isinstance(obj, dict) and isinstance(obj.get('points'), list):
-        names = obj.get('joint_names') or obj.get('names') or []
-        names = list(names) if isinstance(names, (list, tuple)) else []
-        for pt in obj['points']:
-            if not isinstance(pt, dict):
-                continue
-            positions = pt.get('positions') or pt.get('position') or []
-            positions = list(positions) if isinstance(positions, (list, tuple)) else []
-            jvals = [
-                pick_value_by_name(names, positions, 1),
-                pick_value_by_name(names, positions, 2),
-                pick_value_by_name(names, positions, 3),
-                pick_value_by_name(names, positions, 4),
-                pick_value_by_name(names, positions, 5),
-                pick_value_by_name(names, positions, 6),
-            ]
-            jvals = ensure_six(jvals)
-            frames.append({
-                'joint1': jvals[0],
-                'joint2': jvals[1],
-                'joint3': jvals[2],
-                'joint4': jvals[3],
-                'joint5': jvals[4],
-                'joint6': jvals[5],
-            })
-        return frames, len(frames)
-
-    # Shapes A/B: joint_states list or plain list of entries
-    seq = None
-    if isinstance(obj, dict):
-        if isinstance(obj.get('joint_states'), list):
-            seq = obj['joint_states']
-        else:
-            # fallback: first list-like value
-            for v in obj.values():
-                if isinstance(v, list):
-                    seq = v
-                    break
-    elif isinstance(obj, list):
-        seq = obj
-
-    if not isinstance(seq, list) or not seq:
-        return [], 0
-
-    for entry in seq:
-        if not isinstance(entry, dict):
-            continue
-        names = entry.get('name') or entry.get('names') or []
-        positions = entry.get('position') or entry.get('positions') or []
-        try:
-            names = list(names) if isinstance(names, (list, tuple)) else []
-            positions = list(positions) if isinstance(positions, (list, tuple)) else []
-        except Exception:
-            names = []
-            positions = []
-
-        jvals = [
-            pick_value_by_name(names, positions, 1),
-            pick_value_by_name(names, positions, 2),
-            pick_value_by_name(names, positions, 3),
-            pick_value_by_name(names, positions, 4),
-            pick_value_by_name(names, positions, 5),
-            pick_value_by_name(names, positions, 6),
-        ]
-        jvals = ensure_six(jvals)
-
-        frames.append({
-            'joint1': jvals[0],
-            'joint2': jvals[1],
-            'joint3': jvals[2],
-            'joint4': jvals[3],
-            'joint5': jvals[4],
-            'joint6': jvals[5],
-        })
-
-    return frames, len(frames)
-
-
-def write_jsonl(path: str, rows: List[Dict[str, float]]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False))
-            f.write('\n')
+    if ijson is None or not _is_shape_c(input_path):
+        return None
+
+    names = _stream_item(input_path, 'joint_names') or _stream_item(input_path, 'names') or []
+    names = list(names) if isinstance(names, (list, tuple)) else []
+    cols = joint_columns(names)
+
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(out_dir, exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    count = 0
+    chunk: List[str] = []
+    try:
+        with _open_json_bytes(input_path) as src, open(tmp_path, 'w', encoding='utf-8') as dst:
+            for pt in ijson.items(src, 'points.item', use_float=True):
+                if not isinstance(pt, dict):
+                    continue
+                p = pt.get('positions') or pt.get('position') or []
+                if not isinstance(p, (list, tuple)):
+                    p = []
+                chunk.append(format_row(tuple(float(p[c]) if c < len(p) else 0.0 for c in cols)))
+                if len(chunk) == WRITE_BATCH:
+                    dst.write('\n'.join(chunk) + '\n')
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                dst.write('\n'.join(chunk) + '\n')
+                count += len(chunk)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
 
 
 def main(argv: List[str]) -> int:
@@ -174,13 +170,29 @@ def main(argv: List[str]) -> int:
         print(f'[ERROR] Input file not found: {args.input}')
         return 1
 
+    # Shape C streams straight to the output when ijson is installed
+    try:
+        count = parse_and_stream(args.input, args.output)
+    except Exception as e:
+        # NaN/Infinity only parse with the stdlib; anything else would fail there too
+        if not _has_nonfinite_literal(args.input):
+            print(f'[ERROR] Failed to read JSON: {e}')
+            return 2
+        count = None
+    if count is not None:
+        if count == 0:
+            print('[WARN] No frames parsed; writing empty file')
+        print(f'[OK] Wrote {count} lines to {args.output}')
+        return 0
+
     try:
         obj = read_json(args.input)
     except Exception as e:
         print(f'[ERROR] Failed to read JSON: {e}')
         return 2
 
-    frames, count = parse_frames(obj)
+    frames = parse_frames(obj)
+    count = len(frames)
     if count == 0:
         print('[WARN] No frames parsed; writing empty file')
 
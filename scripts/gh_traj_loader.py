@@ -16,7 +16,16 @@
 #   or use execfile() / import techniques as you prefer.
 
 import os
+import sys
 import json
+import hashlib
+
+# Make scripts/_joint_parse.py importable when pasted into a GhPython component
+_SCRIPTS_DIR = (os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals()
+                else r"/Users/avery_tsai/project/hiwin_prc/scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+from _joint_parse import format_row, parse_frames
 
 try:
     import scriptcontext as sc
@@ -38,138 +47,40 @@ def _get_cache():
     return cache
 
 
-def _read_json_obj(path):
-    # Prefer UTF-8; fall back to UTF-8-sig if BOM exists
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except ValueError:
-        with open(path, 'r', encoding='utf-8-sig') as f:
-            return json.load(f)
+def _read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
 
 
-def _read_text(path):
-    # Read as text for debugging/inspection
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception:
-        with open(path, 'r', encoding='utf-8-sig', errors='ignore') as f:
-            return f.read()
-
-# ===== Helpers for JSON -> JSONL (joint1..joint6) =====
-
-def _normalize_name(name):
-    try:
-        return str(name).strip().lower().replace('_', '')
-    except Exception:
-        return ''
+def _json_obj_from_bytes(raw):
+    # Drop a UTF-8 BOM instead of retrying with utf-8-sig
+    data = raw[3:] if raw[:3] == b'\xef\xbb\xbf' else raw
+    return json.loads(data.decode('utf-8'))
 
 
-def _pick_value_by_name(names, positions, j_index):
-    target = 'joint{}'.format(j_index)
+def _text_from_bytes(raw):
+    # Same result as reading the file in text mode (BOM kept, newlines translated)
     try:
-        norm = [_normalize_name(n) for n in (names or [])]
-        for i, n in enumerate(norm):
-            if n == target:
-                return float(positions[i]) if i < len(positions or []) else 0.0
-    except Exception:
-        pass
-    # fallback by index (1-based)
-    if isinstance(positions, (list, tuple)) and len(positions) >= j_index:
-        return float(positions[j_index - 1])
-    return 0.0
-
-
-def _ensure_six(values):
-    vals = list(values[:6]) if isinstance(values, (list, tuple)) else []
-    if len(vals) < 6:
-        vals += [0.0] * (6 - len(vals))
-    return vals
-
-
-def _parse_frames_any(obj):
-    # Shape C: {"joint_names": [...], "points": [ {"positions": [...]}, ... ]}
-    if isinstance(obj, dict) and isinstance(obj.get('points'), list):
-        names = obj.get('joint_names') or obj.get('names') or []
-        if not isinstance(names, (list, tuple)):
-            names = []
-        frames = []
-        for pt in obj['points']:
-            if not isinstance(pt, dict):
-                continue
-            positions = pt.get('positions') or pt.get('position') or []
-            if not isinstance(positions, (list, tuple)):
-                positions = []
-            jvals = [
-                _pick_value_by_name(names, positions, 1),
-                _pick_value_by_name(names, positions, 2),
-                _pick_value_by_name(names, positions, 3),
-                _pick_value_by_name(names, positions, 4),
-                _pick_value_by_name(names, positions, 5),
-                _pick_value_by_name(names, positions, 6),
-            ]
-            jvals = _ensure_six(jvals)
-            frames.append({
-                'joint1': jvals[0],
-                'joint2': jvals[1],
-                'joint3': jvals[2],
-                'joint4': jvals[3],
-                'joint5': jvals[4],
-                'joint6': jvals[5],
-            })
-        return frames
-
-    # Shape A/B: joint_states list or plain list of entries
-    seq = None
-    if isinstance(obj, dict):
-        if isinstance(obj.get('joint_states'), list):
-            seq = obj['joint_states']
-        else:
-            # fallback: first list-like value
-            for v in obj.values():
-                if isinstance(v, list):
-                    seq = v
-                    break
-    elif isinstance(obj, list):
-        seq = obj
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        text = raw.decode('utf-8-sig', 'ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
-    if not isinstance(seq, list) or not seq:
-        return []
 
-    frames = []
-    for entry in seq:
-        if not isinstance(entry, dict):
-            continue
-        names = entry.get('name') or entry.get('names') or []
-        positions = entry.get('position') or entry.get('positions') or []
-        if not isinstance(names, (list, tuple)):
-            names = []
-        if not isinstance(positions, (list, tuple)):
-            positions = []
-        jvals = [
-            _pick_value_by_name(names, positions, 1),
-            _pick_value_by_name(names, positions, 2),
-            _pick_value_by_name(names, positions, 3),
-            _pick_value_by_name(names, positions, 4),
-            _pick_value_by_name(names, positions, 5),
-            _pick_value_by_name(names, positions, 6),
-        ]
-        jvals = _ensure_six(jvals)
-        frames.append({
-            'joint1': jvals[0],
-            'joint2': jvals[1],
-            'joint3': jvals[2],
-            'joint4': jvals[3],
-            'joint5': jvals[4],
-            'joint6': jvals[5],
-        })
-    return frames
+def _content_key(abspath, raw, ext):
+    # Identifies the file by content, so a new mtime with the same bytes
+    # (git checkout, copy-over) reuses the cached parse
+    return ('TRAJ_CONTENT', abspath, len(raw), hashlib.blake2b(raw, digest_size=8).digest(), ext)
 
+# ===== Helpers for JSON -> JSONL (joint1..joint6) =====
+# Shape parsing is shared with convert_joint_json_to_jsonl.py (scripts/_joint_parse.py)
 
 def _frames_to_jsonl_lines(frames):
+    # frames are (joint1..joint6) tuples
     try:
-        return [json.dumps(row, ensure_ascii=False) for row in frames]
+        return [format_row(row) for row in frames]
     except Exception:
         return []
 
@@ -271,29 +182,32 @@ try:
         if _reload and cache:
             cache.clear()
 
-        if key in cache:
-            Data, Text, JSONL, Lines, OutPath, Count = cache[key]
-        else:
+        if key not in cache:
             abspath = os.path.abspath(_path)
-            if ext == '.jsonl':
-                Text = _read_text(_path)
-                Lines = [ln for ln in Text.splitlines() if ln.strip()]
-                JSONL = '\n'.join(Lines) + ('\n' if Lines else '')
-                OutPath = abspath
-                Count = len(Lines)
-                Data = None
-            else:
-                # Treat as JSON and convert to JSONL
-                Data = _read_json_obj(_path)
-                Text = _read_text(_path)
-                frames = _parse_frames_any(Data)
-                Lines = _frames_to_jsonl_lines(frames)
-                JSONL = '\n'.join(Lines) + ('\n' if Lines else '')
-                Count = len(Lines)
-                OutPath = os.path.splitext(abspath)[0] + '.jsonl'
-                if JSONL:
-                    _write_text_safe(OutPath, JSONL)
-            cache[key] = (Data, Text, JSONL, Lines, OutPath, Count)
+            raw = _read_bytes(_path)
+            content_key = _content_key(abspath, raw, ext)
+            if content_key not in cache:
+                Text = _text_from_bytes(raw)
+                if ext == '.jsonl':
+                    Lines = [ln for ln in Text.splitlines() if ln.strip()]
+                    JSONL = '\n'.join(Lines) + ('\n' if Lines else '')
+                    OutPath = abspath
+                    Count = len(Lines)
+                    Data = None
+                else:
+                    # Treat as JSON and convert to JSONL
+                    Data = _json_obj_from_bytes(raw)
+                    frames = parse_frames(Data)
+                    Lines = _frames_to_jsonl_lines(frames)
+                    JSONL = '\n'.join(Lines) + ('\n' if Lines else '')
+                    Count = len(Lines)
+                    OutPath = os.path.splitext(abspath)[0] + '.jsonl'
+                    if JSONL:
+                        _write_text_safe(OutPath, JSONL)
+                cache[content_key] = (Data, Text, JSONL, Lines, OutPath, Count)
+            cache[key] = cache[content_key]
+
+        Data, Text, JSONL, Lines, OutPath, Count = cache[key]
 
 except Exception:
     Data, Text, JSONL, Lines, OutPath, Count = None, '', '', [], '', 0
@@ -12,8 +12,28 @@
 #   I     (int)         - The selected 0-based index
 
 import os
+import re
 import json
 
+try:
+    import scriptcontext as sc
+except ImportError:
+    sc = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CACHE_KEY = 'GH_TRAJ_PLAYER_CACHE'
+BATCH_MIN_LINES = 64  # parse every row on the first cache reuse once the input is at least this long
+
+# Fast path for rows in the loader/converter schema: {"joint1":v1, ..., "joint6":v6}
+_NUM = r'(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)'
+_ROW_RE = re.compile(
+    r'\s*\{\s*' + r'\s*,\s*'.join(r'"joint%d"\s*:\s*' % k + _NUM for k in range(1, 7)) + r'\s*\}\s*$'
+)
+
 
 def _read_text(path):
     try:
@@ -27,22 +47,71 @@ def _read_text(path):
             return ''
 
 
+def _component_slot():
+    # One cache slot per GhPython component so several players do not evict each other
+    try:
+        return str(ghenv.Component.InstanceGuid)  # type: ignore[name-defined]
+    except Exception:
+        return ''
+
+
+def _cached_lines(key, src, build):
+    # Per-component cache in sc.sticky: slot -> [key, src, lines, parsed, batched], parsed[i]
+    # filled on first visit. A hit needs the same key and an equal src (content, not object
+    # identity: GhPython passes a new list for a list input on every solve).
+    store = getattr(sc, 'sticky', None) if sc is not None else None
+    if store is None:
+        lines = build()
+        return lines, [None] * len(lines)
+    slots = store.get(CACHE_KEY)
+    if not isinstance(slots, dict):
+        slots = store[CACHE_KEY] = {}
+    slot = _component_slot()
+    entry = slots.get(slot)
+    if entry is not None and entry[0] == key and (entry[1] is src or entry[1] == src):
+        if not entry[4]:
+            # Reused at least once (slider scrubbing): parse the remaining rows in one pass
+            entry[4] = True
+            _parse_all(entry[2], entry[3])
+        return entry[2], entry[3]
+    lines = build()
+    parsed = [None] * len(lines)
+    # Keep a copy of a list input so a caller mutating its list cannot fake a hit
+    slots[slot] = [key, list(src) if isinstance(src, list) else src, lines, parsed, False]
+    return lines, parsed
+
+
+def _parse_all(lines, parsed):
+    # Scrubbing visits most rows eventually: fill parsed with all fixed-schema rows in
+    # one numpy pass. Otherwise (short input, no numpy, any non-schema row) stay lazy.
+    count = len(lines)
+    if np is None or count < BATCH_MIN_LINES:
+        return
+    matches = [_ROW_RE.match(ln) for ln in lines]
+    if not all(matches):
+        return
+    arr = np.fromiter((v for m in matches for v in m.groups()), dtype=np.float64, count=6 * count)
+    parsed[:] = arr.reshape(-1, 6).tolist()
+
+
 def _build_lines():
+    # Returns (lines, parsed) where parsed caches _parse_joints_from_line per index
     # Prefer Lines input if present
     lines_val = globals().get('Lines', None)
     if isinstance(lines_val, (list, tuple)):
-        return [str(x) for x in lines_val if str(x).strip()]
+        return _cached_lines(('LINES', len(lines_val)), lines_val,
+                             lambda: [str(x) for x in lines_val if str(x).strip()])
     # Fallback to JSONL text
     jsonl_val = globals().get('JSONL', None)
     if isinstance(jsonl_val, str) and jsonl_val:
-        return [ln for ln in jsonl_val.splitlines() if ln.strip()]
+        return _cached_lines(('JSONL', hash(jsonl_val)), jsonl_val,
+                             lambda: [ln for ln in jsonl_val.splitlines() if ln.strip()])
     # Fallback to Path to read file
     path_val = globals().get('Path', None)
-    if path_val:
-        text = _read_text(path_val)
-        if text:
-            return [ln for ln in text.splitlines() if ln.strip()]
-    return []
+    if path_val and os.path.isfile(path_val):
+        return _cached_lines(('PATH', path_val, os.path.getmtime(path_val)), path_val,
+                             lambda: [ln for ln in _read_text(path_val).splitlines() if ln.strip()])
+    return [], []
 
 
 def _to_index(count):
@@ -77,6 +146,10 @@ def _to_index(count):
 
 def _parse_joints_from_line(line):
     # Expect dict with joint1..joint6; provide a fallback for position arrays
+    m = _ROW_RE.match(line)
+    if m:
+        return [float(v) for v in m.groups()]
+
     try:
         obj = json.loads(line)
     except Exception:
@@ -105,7 +178,7 @@ def _parse_joints_from_line(line):
 
 # -------- Grasshopper entry point --------
 try:
-    _lines = _build_lines()
+    _lines, _parsed = _build_lines()
     Count = len(_lines)
 
     if Count <= 0:
@@ -113,7 +186,9 @@ try:
     else:
         I = _to_index(Count)
         Line = _lines[I]
-        J = _parse_joints_from_line(Line)
+        J = _parsed[I]
+        if J is None:
+            J = _parsed[I] = _parse_joints_from_line(Line)
 
 except Exception:
     J, Count, Line, I = [], 0, '', 0
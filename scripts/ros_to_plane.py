@@ -6,18 +6,18 @@ except ImportError:
     rg = None
 
 
-def _rotation_matrix_from_rpy(roll_rad, pitch_rad, yaw_rad):
+def _rot_from_rpy(roll_rad, pitch_rad, yaw_rad):
     """從 RPY 歐拉角計算旋轉矩陣 (ZYX 慣例)
-    
+
     R = Rz(yaw) * Ry(pitch) * Rx(roll)
-    
+
     Args:
         roll_rad: Roll 角度 (弧度)
         pitch_rad: Pitch 角度 (弧度)
         yaw_rad: Yaw 角度 (弧度)
-    
+
     Returns:
-        3x3 旋轉矩陣 (list of lists)
+        9 個浮點數的 tuple (r11, r12, r13, r21, r22, r23, r31, r32, r33)
     """
     cr = math.cos(roll_rad)
     sr = math.sin(roll_rad)
@@ -25,28 +25,13 @@ def _rotation_matrix_from_rpy(roll_rad, pitch_rad, yaw_rad):
     sp = math.sin(pitch_rad)
     cy = math.cos(yaw_rad)
     sy = math.sin(yaw_rad)
-    
+
     # R = Rz * Ry * Rx
-    # 第一列
-    r11 = cy * cp
-    r12 = cy * sp * sr - sy * cr
-    r13 = cy * sp * cr + sy * sr
-    
-    # 第二列
-    r21 = sy * cp
-    r22 = sy * sp * sr + cy * cr
-    r23 = sy * sp * cr - cy * sr
-    
-    # 第三列
-    r31 = -sp
-    r32 = cp * sr
-    r33 = cp * cr
-    
-    return [
-        [r11, r12, r13],
-        [r21, r22, r23],
-        [r31, r32, r33]
-    ]
+    return (
+        cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr,  # 第一列
+        sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr,  # 第二列
+        -sp, cp * sr, cp * cr,                                     # 第三列
+    )
 
 
 def ros_to_plane(x_m, y_m, z_m, roll_val, pitch_val, yaw_val, use_radians=False):
@@ -84,15 +69,13 @@ def ros_to_plane(x_m, y_m, z_m, roll_val, pitch_val, yaw_val, use_radians=False)
         yaw_rad = math.radians(yaw_val)
 
     # 計算旋轉矩陣
-    R = _rotation_matrix_from_rpy(roll_rad, pitch_rad, yaw_rad)
-
-    # 從旋轉矩陣提取軸向量（列向量）
-    x_axis = rg.Vector3d(R[0][0], R[1][0], R[2][0])
-    y_axis = rg.Vector3d(R[0][1], R[1][1], R[2][1])
-    # z 軸可由 x,y 推得，亦可直接使用矩陣第三列
-    # 這裡仍計算並單位化，雖然不回傳
-    z_axis = rg.Vector3d(R[0][2], R[1][2], R[2][2])
-    x_axis.Unitize(); y_axis.Unitize(); z_axis.Unitize()
+    r11, r12, _, r21, r22, _, r31, r32, _ = _rot_from_rpy(roll_rad, pitch_rad, yaw_rad)
+
+    # 從旋轉矩陣提取軸向量（行向量）
+    # 旋轉矩陣為正交矩陣，各行已是單位向量，不需 Unitize；
+    # z 軸由 Plane 以 x,y 推得，不另外建立
+    x_axis = rg.Vector3d(r11, r21, r31)
+    y_axis = rg.Vector3d(r12, r22, r32)
 
     # 建立 Plane 並只回傳 plane
     plane = rg.Plane(origin, x_axis, y_axis)